@@ -73,6 +73,202 @@ const defaultStreamConfig: StreamConfig = {
   filterOutliers: true,
 };
 
+/**
+ * Default clinical alert thresholds by biometric type
+ */
+const defaultAlertThresholds = new Map<BiometricType, BiometricThreshold[]>([
+  [
+    'heartRate',
+    [
+      { min: 40, max: 60, label: 'Bradycardia', priority: 'warning' },
+      { min: 100, max: 120, label: 'Tachycardia', priority: 'warning' },
+      { min: 0, max: 40, label: 'Severe Bradycardia', priority: 'urgent' },
+      {
+        min: 120,
+        max: 999,
+        label: 'Severe Tachycardia',
+        priority: 'urgent',
+      },
+    ],
+  ],
+  [
+    'bloodPressureSystolic',
+    [
+      { min: 90, max: 120, label: 'Normal', priority: 'informational' },
+      { min: 120, max: 140, label: 'Elevated', priority: 'informational' },
+      {
+        min: 140,
+        max: 160,
+        label: 'Hypertension Stage 1',
+        priority: 'warning',
+      },
+      {
+        min: 160,
+        max: 180,
+        label: 'Hypertension Stage 2',
+        priority: 'warning',
+      },
+      {
+        min: 180,
+        max: 999,
+        label: 'Hypertensive Crisis',
+        priority: 'urgent',
+      },
+      { min: 0, max: 90, label: 'Hypotension', priority: 'warning' },
+    ],
+  ],
+  [
+    'bloodPressureDiastolic',
+    [
+      { min: 60, max: 80, label: 'Normal', priority: 'informational' },
+      { min: 80, max: 90, label: 'Elevated', priority: 'informational' },
+      {
+        min: 90,
+        max: 100,
+        label: 'Hypertension Stage 1',
+        priority: 'warning',
+      },
+      {
+        min: 100,
+        max: 110,
+        label: 'Hypertension Stage 2',
+        priority: 'warning',
+      },
+      {
+        min: 110,
+        max: 999,
+        label: 'Hypertensive Crisis',
+        priority: 'urgent',
+      },
+      { min: 0, max: 60, label: 'Hypotension', priority: 'warning' },
+    ],
+  ],
+  [
+    'respiratoryRate',
+    [
+      { min: 12, max: 20, label: 'Normal', priority: 'informational' },
+      { min: 8, max: 12, label: 'Low', priority: 'warning' },
+      { min: 20, max: 30, label: 'Elevated', priority: 'warning' },
+      { min: 0, max: 8, label: 'Critical Low', priority: 'urgent' },
+      { min: 30, max: 999, label: 'Critical High', priority: 'urgent' },
+    ],
+  ],
+  [
+    'bodyTemperature',
+    [
+      { min: 36.5, max: 37.5, label: 'Normal', priority: 'informational' },
+      { min: 35.0, max: 36.5, label: 'Low', priority: 'warning' },
+      { min: 37.5, max: 38.5, label: 'Fever', priority: 'warning' },
+      { min: 0, max: 35.0, label: 'Hypothermia', priority: 'urgent' },
+      { min: 38.5, max: 41.5, label: 'High Fever', priority: 'urgent' },
+      {
+        min: 41.5,
+        max: 999,
+        label: 'Critical Hyperthermia',
+        priority: 'urgent',
+      },
+    ],
+  ],
+  [
+    'oxygenSaturation',
+    [
+      { min: 95, max: 100, label: 'Normal', priority: 'informational' },
+      { min: 91, max: 95, label: 'Low', priority: 'warning' },
+      { min: 85, max: 91, label: 'Very Low', priority: 'warning' },
+      { min: 0, max: 85, label: 'Critical', priority: 'urgent' },
+    ],
+  ],
+  [
+    'bloodGlucose',
+    [
+      { min: 70, max: 140, label: 'Normal', priority: 'informational' },
+      { min: 140, max: 180, label: 'Elevated', priority: 'informational' },
+      { min: 40, max: 70, label: 'Low', priority: 'warning' },
+      { min: 180, max: 250, label: 'High', priority: 'warning' },
+      { min: 0, max: 40, label: 'Critical Low', priority: 'urgent' },
+      { min: 250, max: 999, label: 'Critical High', priority: 'urgent' },
+    ],
+  ],
+  [
+    'cortisol',
+    [
+      { min: 5, max: 23, label: 'Normal', priority: 'informational' },
+      { min: 23, max: 40, label: 'Elevated', priority: 'warning' },
+      { min: 0, max: 5, label: 'Low', priority: 'warning' },
+      { min: 40, max: 999, label: 'Critically High', priority: 'warning' },
+    ],
+  ],
+  [
+    'sleepQuality',
+    [
+      { min: 70, max: 100, label: 'Good', priority: 'informational' },
+      { min: 50, max: 70, label: 'Fair', priority: 'informational' },
+      { min: 30, max: 50, label: 'Poor', priority: 'warning' },
+      { min: 0, max: 30, label: 'Very Poor', priority: 'warning' },
+    ],
+  ],
+  [
+    'eegThetaPower',
+    [
+      { min: 0, max: 100, label: 'Normal', priority: 'informational' },
+      // Custom thresholds would be set by clinical team
+    ],
+  ],
+  [
+    'motionActivity',
+    [
+      { min: 0, max: 100, label: 'Normal', priority: 'informational' },
+      // Thresholds determined by baseline activity patterns
+    ],
+  ],
+]);
+
+/**
+ * Default normal ranges by biometric type
+ */
+const defaultNormalRanges = new Map<BiometricType, [number, number]>([
+  ['heartRate', [60, 100]],
+  ['bloodPressureSystolic', [90, 120]],
+  ['bloodPressureDiastolic', [60, 80]],
+  ['respiratoryRate', [12, 20]],
+  ['bodyTemperature', [36.5, 37.5]],
+  ['oxygenSaturation', [95, 100]],
+  ['bloodGlucose', [70, 140]],
+  ['cortisol', [5, 23]],
+  ['sleepQuality', [70, 100]],
+  // Other metrics would be set based on patient baseline
+]);
+
+/**
+ * Display order of alert priorities, most severe first
+ */
+const alertPriorityOrder: Record<AlertPriority, number> = {
+  urgent: 0,
+  warning: 1,
+  informational: 2,
+};
+
+/**
+ * Standard normal variate via Box-Muller
+ * Each transform yields two independent variates; the second is kept for the next call
+ */
+let spareNormal: number | null = null;
+
+const randNormal = (): number => {
+  if (spareNormal !== null) {
+    const z1 = spareNormal;
+    spareNormal = null;
+    return z1;
+  }
+
+  const u1 = 1 - Math.random(); // (0, 1] keeps the log finite
+  const u2 = Math.random();
+  const radius = Math.sqrt(-2 * Math.log(u1));
+  const angle = 2 * Math.PI * u2;
+  spareNormal = radius * Math.sin(angle);
+  return radius * Math.cos(angle);
+};
+
 /**
  * Initial stream state with safe defaults
  */
@@ -119,158 +315,10 @@ export function useBiometricStreamController(
 
   // Initialize with default thresholds
   useEffect(() => {
-    // Set up default alert thresholds
-    const defaultThresholds = new Map<BiometricType, BiometricThreshold[]>([
-      [
-        'heartRate',
-        [
-          { min: 40, max: 60, label: 'Bradycardia', priority: 'warning' },
-          { min: 100, max: 120, label: 'Tachycardia', priority: 'warning' },
-          { min: 0, max: 40, label: 'Severe Bradycardia', priority: 'urgent' },
-          {
-            min: 120,
-            max: 999,
-            label: 'Severe Tachycardia',
-            priority: 'urgent',
-          },
-        ],
-      ],
-      [
-        'bloodPressureSystolic',
-        [
-          { min: 90, max: 120, label: 'Normal', priority: 'informational' },
-          { min: 120, max: 140, label: 'Elevated', priority: 'informational' },
-          {
-            min: 140,
-            max: 160,
-            label: 'Hypertension Stage 1',
-            priority: 'warning',
-          },
-          {
-            min: 160,
-            max: 180,
-            label: 'Hypertension Stage 2',
-            priority: 'warning',
-          },
-          {
-            min: 180,
-            max: 999,
-            label: 'Hypertensive Crisis',
-            priority: 'urgent',
-          },
-          { min: 0, max: 90, label: 'Hypotension', priority: 'warning' },
-        ],
-      ],
-      [
-        'bloodPressureDiastolic',
-        [
-          { min: 60, max: 80, label: 'Normal', priority: 'informational' },
-          { min: 80, max: 90, label: 'Elevated', priority: 'informational' },
-          {
-            min: 90,
-            max: 100,
-            label: 'Hypertension Stage 1',
-            priority: 'warning',
-          },
-          {
-            min: 100,
-            max: 110,
-            label: 'Hypertension Stage 2',
-            priority: 'warning',
-          },
-          {
-            min: 110,
-            max: 999,
-            label: 'Hypertensive Crisis',
-            priority: 'urgent',
-          },
-          { min: 0, max: 60, label: 'Hypotension', priority: 'warning' },
-        ],
-      ],
-      [
-        'respiratoryRate',
-        [
-          { min: 12, max: 20, label: 'Normal', priority: 'informational' },
-          { min: 8, max: 12, label: 'Low', priority: 'warning' },
-          { min: 20, max: 30, label: 'Elevated', priority: 'warning' },
-          { min: 0, max: 8, label: 'Critical Low', priority: 'urgent' },
-          { min: 30, max: 999, label: 'Critical High', priority: 'urgent' },
-        ],
-      ],
-      [
-        'bodyTemperature',
-        [
-          { min: 36.5, max: 37.5, label: 'Normal', priority: 'informational' },
-          { min: 35.0, max: 36.5, label: 'Low', priority: 'warning' },
-          { min: 37.5, max: 38.5, label: 'Fever', priority: 'warning' },
-          { min: 0, max: 35.0, label: 'Hypothermia', priority: 'urgent' },
-          { min: 38.5, max: 41.5, label: 'High Fever', priority: 'urgent' },
-          {
-            min: 41.5,
-            max: 999,
-            label: 'Critical Hyperthermia',
-            priority: 'urgent',
-          },
-        ],
-      ],
-      [
-        'oxygenSaturation',
-        [
-          { min: 95, max: 100, label: 'Normal', priority: 'informational' },
-          { min: 91, max: 95, label: 'Low', priority: 'warning' },
-          { min: 85, max: 91, label: 'Very Low', priority: 'warning' },
-          { min: 0, max: 85, label: 'Critical', priority: 'urgent' },
-        ],
-      ],
-      [
-        'bloodGlucose',
-        [
-          { min: 70, max: 140, label: 'Normal', priority: 'informational' },
-          { min: 140, max: 180, label: 'Elevated', priority: 'informational' },
-          { min: 40, max: 70, label: 'Low', priority: 'warning' },
-          { min: 180, max: 250, label: 'High', priority: 'warning' },
-          { min: 0, max: 40, label: 'Critical Low', priority: 'urgent' },
-          { min: 250, max: 999, label: 'Critical High', priority: 'urgent' },
-        ],
-      ],
-      [
-        'cortisol',
-        [
-          { min: 5, max: 23, label: 'Normal', priority: 'informational' },
-          { min: 23, max: 40, label: 'Elevated', priority: 'warning' },
-          { min: 0, max: 5, label: 'Low', priority: 'warning' },
-          { min: 40, max: 999, label: 'Critically High', priority: 'warning' },
-        ],
-      ],
-      [
-        'sleepQuality',
-        [
-          { min: 70, max: 100, label: 'Good', priority: 'informational' },
-          { min: 50, max: 70, label: 'Fair', priority: 'informational' },
-          { min: 30, max: 50, label: 'Poor', priority: 'warning' },
-          { min: 0, max: 30, label: 'Very Poor', priority: 'warning' },
-        ],
-      ],
-      [
-        'eegThetaPower',
-        [
-          { min: 0, max: 100, label: 'Normal', priority: 'informational' },
-          // Custom thresholds would be set by clinical team
-        ],
-      ],
-      [
-        'motionActivity',
-        [
-          { min: 0, max: 100, label: 'Normal', priority: 'informational' },
-          // Thresholds determined by baseline activity patterns
-        ],
-      ],
-    ]);
-
     // Apply default thresholds where not already defined
     const mergedThresholds = new Map(config.alertThresholds);
 
-    defaultThresholds.forEach((thresholds, type) => {
+    defaultAlertThresholds.forEach((thresholds, type) => {
       if (!mergedThresholds.has(type)) {
         mergedThresholds.set(type, thresholds);
       }
@@ -279,23 +327,9 @@ export function useBiometricStreamController(
     // Update config with merged thresholds
     config.alertThresholds = mergedThresholds;
 
-    // Set normal ranges
-    const normalRanges = new Map<BiometricType, [number, number]>([
-      ['heartRate', [60, 100]],
-      ['bloodPressureSystolic', [90, 120]],
-      ['bloodPressureDiastolic', [60, 80]],
-      ['respiratoryRate', [12, 20]],
-      ['bodyTemperature', [36.5, 37.5]],
-      ['oxygenSaturation', [95, 100]],
-      ['bloodGlucose', [70, 140]],
-      ['cortisol', [5, 23]],
-      ['sleepQuality', [70, 100]],
-      // Other metrics would be set based on patient baseline
-    ]);
-
     setState((prevState) => ({
       ...prevState,
-      normalRanges,
+      normalRanges: defaultNormalRanges,
     }));
   }, [config.alertThresholds]);
 
@@ -466,13 +500,6 @@ export function useBiometricStreamController(
       const stdDev = (normalRange[1] - normalRange[0]) / 6; // ~99% within range
 
       // Generate normally distributed random value
-      const randNormal = () => {
-        const u1 = Math.random();
-        const u2 = Math.random();
-        const z0 = Math.sqrt(-2 * Math.log(u1)) * Math.cos(2 * Math.PI * u2);
-        return z0;
-      };
-
       const randomValue = mean + stdDev * randNormal();
 
       // Occasionally generate out-of-range values to trigger alerts
@@ -501,6 +528,9 @@ export function useBiometricStreamController(
       const startTime = performance.now();
 
       setState((prevState) => {
+        // Single clock read shared by alert timestamps/ids and sync times
+        const now = new Date();
+
         // Get current data for this stream
         const streamData = prevState.streamData.get(streamId) || [];
 
@@ -508,15 +538,21 @@ export function useBiometricStreamController(
         if (config.filterOutliers) {
           // Simple outlier detection
           if (streamData.length > 10) {
-            const recentValues = streamData
-              .slice(Math.max(0, streamData.length - 10))
-              .map((dp) => dp.value);
+            // Mean and variance over the trailing window, read in place
+            const windowSize = 10;
+            const windowStart = streamData.length - windowSize;
+            let sum = 0;
+            for (let i = windowStart; i < streamData.length; i++) {
+              sum += streamData[i].value;
+            }
+            const mean = sum / windowSize;
 
-            const mean = recentValues.reduce((sum, val) => sum + val, 0) / recentValues.length;
-            const stdDev = Math.sqrt(
-              recentValues.reduce((sum, val) => sum + Math.pow(val - mean, 2), 0) /
-                recentValues.length
-            );
+            let squaredDiffSum = 0;
+            for (let i = windowStart; i < streamData.length; i++) {
+              const diff = streamData[i].value - mean;
+              squaredDiffSum += diff * diff;
+            }
+            const stdDev = Math.sqrt(squaredDiffSum / windowSize);
 
             // If value is more than 3 standard deviations from mean, flag as outlier
             if (Math.abs(dataPoint.value - mean) > 3 * stdDev) {
@@ -550,27 +586,32 @@ export function useBiometricStreamController(
         if (stream) {
           const thresholds = config.alertThresholds.get(dataPoint.type) || [];
 
+          // Whether a non-informational alert exists for this metric; scanned at most
+          // once, then kept current as alerts are added or evicted
+          const isEscalatedAlert = (alert: BiometricAlert) =>
+            alert.streamId === streamId &&
+            alert.biometricType === dataPoint.type &&
+            alert.priority !== 'informational';
+          let hasEscalatedAlert: boolean | undefined;
+
           // Check each threshold
           for (const threshold of thresholds) {
             if (dataPoint.value < threshold.min || dataPoint.value > threshold.max) {
               // Skip informational alerts if we're beyond a threshold for the same metric
-              if (
-                threshold.priority === 'informational' &&
-                newAlerts.some(
-                  (alert) =>
-                    alert.streamId === streamId &&
-                    alert.biometricType === dataPoint.type &&
-                    alert.priority !== 'informational'
-                )
-              ) {
-                continue;
+              if (threshold.priority === 'informational') {
+                if (hasEscalatedAlert === undefined) {
+                  hasEscalatedAlert = newAlerts.some(isEscalatedAlert);
+                }
+                if (hasEscalatedAlert) {
+                  continue;
+                }
               }
 
               // Create alert
               const alert: BiometricAlert = {
-                id: `alert-${streamId}-${Date.now()}`,
+                id: `alert-${streamId}-${now.getTime()}`,
                 patientId: patientId, // Added missing patientId
-                timestamp: new Date(),
+                timestamp: now,
                 streamId,
                 dataPointId: dataPoint.id,
                 type: dataPoint.type, // Added missing type
@@ -584,10 +625,16 @@ export function useBiometricStreamController(
               };
 
               newAlerts.push(alert);
+              if (threshold.priority !== 'informational') {
+                hasEscalatedAlert = true;
+              }
 
               // Limit alerts to most recent 100
               if (newAlerts.length > 100) {
-                newAlerts.shift();
+                const evicted = newAlerts.shift();
+                if (evicted && isEscalatedAlert(evicted)) {
+                  hasEscalatedAlert = undefined; // Rescan on next use
+                }
               }
             }
           }
@@ -601,9 +648,9 @@ export function useBiometricStreamController(
           ...prevState,
           streamData: updatedStreamData,
           alerts: newAlerts,
-          lastSyncTime: new Date(),
+          lastSyncTime: now,
           lastAlertTime:
-            newAlerts.length > prevState.alerts.length ? new Date() : prevState.lastAlertTime,
+            newAlerts.length > prevState.alerts.length ? now : prevState.lastAlertTime,
           metrics: {
             dataPointsProcessed: prevState.metrics.dataPointsProcessed + 1,
             alertsGenerated:
@@ -695,32 +742,46 @@ export function useBiometricStreamController(
 
       const correlations = new Map<string, number>();
 
+      // Extract each stream's recent value window and its sum once, rather than
+      // once per pair it takes part in
+      const windows = new Map<string, { values: number[]; sum: number }>();
+      streamIds.forEach((streamId) => {
+        const data = state.streamData.get(streamId) || [];
+
+        // Need enough data points for correlation
+        if (data.length < 10) return;
+
+        // (This is a simplified version - real implementation would need time alignment)
+        const values = data.slice(Math.max(0, data.length - 100)).map((dp) => dp.value);
+        let sum = 0;
+        for (const value of values) {
+          sum += value;
+        }
+        windows.set(streamId, { values, sum });
+      });
+
       // Calculate correlations for each pair of streams
       for (let i = 0; i < streamIds.length; i++) {
         for (let j = i + 1; j < streamIds.length; j++) {
           const streamIdA = streamIds[i];
           const streamIdB = streamIds[j];
 
-          // Get data for both streams
-          const dataA = state.streamData.get(streamIdA) || [];
-          const dataB = state.streamData.get(streamIdB) || [];
-
-          // Need enough data points for correlation
-          if (dataA.length < 10 || dataB.length < 10) {
+          const windowA = windows.get(streamIdA);
+          const windowB = windows.get(streamIdB);
+          if (!windowA || !windowB) {
             continue;
           }
 
           // Calculate Pearson correlation coefficient
-          // (This is a simplified version - real implementation would need time alignment)
-          const valuesA = dataA.slice(Math.max(0, dataA.length - 100)).map((dp) => dp.value);
-          const valuesB = dataB.slice(Math.max(0, dataB.length - 100)).map((dp) => dp.value);
+          const valuesA = windowA.values;
+          const valuesB = windowB.values;
 
           // Use smallest length
           const n = Math.min(valuesA.length, valuesB.length);
 
           // Calculate means
-          const meanA = valuesA.reduce((sum, val) => sum + val, 0) / n;
-          const meanB = valuesB.reduce((sum, val) => sum + val, 0) / n;
+          const meanA = windowA.sum / n;
+          const meanB = windowB.sum / n;
 
           // Calculate correlation
           let numerator = 0;
@@ -783,6 +844,26 @@ export function useBiometricStreamController(
     };
   }, []);
 
+  // Latest 10 unacknowledged alerts, recomputed only when the alert list changes
+  const latestAlerts = useMemo(
+    () =>
+      state.alerts
+        .filter((a) => !a.acknowledged)
+        .sort((a, b) => {
+          // Sort by priority and then by timestamp
+          const aPriority = alertPriorityOrder[a.priority];
+          const bPriority = alertPriorityOrder[b.priority];
+
+          if (aPriority !== bPriority) {
+            return aPriority - bPriority;
+          }
+
+          return b.timestamp.getTime() - a.timestamp.getTime();
+        })
+        .slice(0, 10),
+    [state.alerts]
+  );
+
   // Return controller interface
   return {
     connectStreams,
@@ -795,21 +876,7 @@ export function useBiometricStreamController(
     getStatus,
     activeStreams: state.activeStreams,
     isConnected: state.isConnected,
-    latestAlerts: state.alerts
-      .filter((a) => !a.acknowledged)
-      .sort((a, b) => {
-        // Sort by priority and then by timestamp
-        const priorityOrder = { urgent: 0, warning: 1, informational: 2 };
-        const aPriority = priorityOrder[a.priority];
-        const bPriority = priorityOrder[b.priority];
-
-        if (aPriority !== bPriority) {
-          return aPriority - bPriority;
-        }
-
-        return b.timestamp.getTime() - a.timestamp.getTime();
-      })
-      .slice(0, 10), // Latest 10 unacknowledged alerts
+    latestAlerts,
   };
 }
 
@@ -80,6 +80,22 @@ const createInitialNeuralState = (): NeuralState => ({
   computationalIntensity: 'medium',
 });
 
+/**
+ * Signed numeric scale for activation levels, shared by all controller instances
+ */
+const ACTIVATION_LEVEL_VALUES: Record<ActivationLevel, number> = {
+  [ActivationLevel.NONE]: -1, // Adjusted mapping based on enum
+  [ActivationLevel.LOW]: -0.5,
+  [ActivationLevel.MEDIUM]: 0,
+  [ActivationLevel.HIGH]: 0.5,
+  [ActivationLevel.EXTREME]: 1,
+};
+
+/**
+ * Valid activation levels, for validating levels returned by the service
+ */
+const VALID_ACTIVATION_LEVELS = new Set<string>(Object.values(ActivationLevel));
+
 /**
  * NeuralActivityController hook for managing neural activity state
  * with clinical-grade precision and type safety
@@ -108,7 +124,7 @@ export function useNeuralActivityController(patientId: string) {
             // Add explicit any type, remove comment
             // Use 'any' for activation
             // Ensure activation.level is a valid ActivationLevel before setting
-            const level = Object.values(ActivationLevel).includes(activation.level)
+            const level = VALID_ACTIVATION_LEVELS.has(activation.level)
               ? activation.level
               : ActivationLevel.MEDIUM; // Default to MEDIUM if invalid // Revert to ternary
             neuralState.metrics.activationLevels.set(
@@ -290,17 +306,7 @@ export function useNeuralActivityController(patientId: string) {
     currentLevel: ActivationLevel, // Corrected type
     activationChange: number
   ): ActivationLevel => {
-    // Corrected type
-    const levelValues: Record<ActivationLevel, number> = {
-      // Corrected type
-      [ActivationLevel.NONE]: -1, // Adjusted mapping based on enum
-      [ActivationLevel.LOW]: -0.5,
-      [ActivationLevel.MEDIUM]: 0,
-      [ActivationLevel.HIGH]: 0.5,
-      [ActivationLevel.EXTREME]: 1,
-    };
-
-    const currentValue = levelValues[currentLevel];
+    const currentValue = ACTIVATION_LEVEL_VALUES[currentLevel];
     const newValue = Math.max(-1, Math.min(1, currentValue + activationChange));
 
     // Map back to activation level enum
@@ -328,9 +334,10 @@ export function useNeuralActivityController(patientId: string) {
           return failure(new Error(errorMessage || 'Failed to load symptom mappings'));
         }
 
+        const symptomIdSet = new Set(symptomIds);
         // eslint-disable-next-line @typescript-eslint/no-explicit-any
         const relevantMappings = mappingsResult.value.filter((mapping: any) =>
-          symptomIds.includes(mapping.symptomId)
+          symptomIdSet.has(mapping.symptomId)
         );
 
         const transforms: NeuralTransform[] = [];
@@ -551,10 +558,10 @@ export function useNeuralActivityController(patientId: string) {
 
   // Initialize on first use
   useEffect(() => {
-    loadBaselineActivity().catch((errorResult) => {
-      // Check if it's a failure Result before logging error
-      if (!errorResult.success) {
-        console.error('Failed to load baseline activity:', errorResult.error);
+    // loadBaselineActivity resolves with a failure Result rather than rejecting
+    loadBaselineActivity().then((result) => {
+      if (Result.isFailure(result)) {
+        console.error('Failed to load baseline activity:', result.error);
       }
     });
   }, [loadBaselineActivity]);
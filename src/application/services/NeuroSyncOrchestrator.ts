@@ -253,35 +253,42 @@ export function useNeuroSyncOrchestrator(
   // Fetch clinical data
   const fetchClinicalData = useCallback(async () => {
     try {
-      // Fetch symptom mappings
-      const symptomResult = await clinicalService.fetchSymptomMappings();
-      if (symptomResult.success && symptomResult.value) {
-        // Check .value
-        dispatch({
-          type: 'SET_SYMPTOM_MAPPINGS',
-          payload: symptomResult.value,
-        });
-      }
-
-      // Fetch diagnosis mappings
-      const diagnosisResult = await clinicalService.fetchDiagnosisMappings();
-      if (diagnosisResult.success && diagnosisResult.value) {
-        // Check .value
-        dispatch({
-          type: 'SET_DIAGNOSIS_MAPPINGS',
-          payload: diagnosisResult.value,
-        });
-      }
-
-      // Fetch treatment predictions
-      const treatmentResult = await clinicalService.fetchTreatmentPredictions(patientId);
-      if (treatmentResult.success && treatmentResult.value) {
-        // Check .value
-        dispatch({
-          type: 'SET_TREATMENT_PREDICTIONS',
-          payload: treatmentResult.value,
-        });
-      }
+      // The three requests are independent, so issue them together and
+      // dispatch each result as soon as it arrives
+      await Promise.all([
+        // Fetch symptom mappings
+        clinicalService.fetchSymptomMappings().then((symptomResult) => {
+          if (symptomResult.success && symptomResult.value) {
+            // Check .value
+            dispatch({
+              type: 'SET_SYMPTOM_MAPPINGS',
+              payload: symptomResult.value,
+            });
+          }
+        }),
+
+        // Fetch diagnosis mappings
+        clinicalService.fetchDiagnosisMappings().then((diagnosisResult) => {
+          if (diagnosisResult.success && diagnosisResult.value) {
+            // Check .value
+            dispatch({
+              type: 'SET_DIAGNOSIS_MAPPINGS',
+              payload: diagnosisResult.value,
+            });
+          }
+        }),
+
+        // Fetch treatment predictions
+        clinicalService.fetchTreatmentPredictions(patientId).then((treatmentResult) => {
+          if (treatmentResult.success && treatmentResult.value) {
+            // Check .value
+            dispatch({
+              type: 'SET_TREATMENT_PREDICTIONS',
+              payload: treatmentResult.value,
+            });
+          }
+        }),
+      ]);
     } catch (error) {
       dispatch({
         type: 'SET_ERROR',
@@ -337,23 +344,26 @@ export function useNeuroSyncOrchestrator(
 
     try {
       // Extract active symptoms from mappings (in production this would come from patient data)
-      const activeSymptomIds = state.symptomMappings
-        .filter((_mapping) => Math.random() > 0.5) // Prefixed unused parameter
-        .map((mapping) => mapping.symptomId);
-
-      // Calculate which regions should be active based on symptom mappings
-      const activatedRegions = state.symptomMappings
-        .filter((mapping) => activeSymptomIds.includes(mapping.symptomId))
-        .flatMap(
-          (
-            mapping // flatMap over mappings
-          ) => mapping.activationPatterns.flatMap((pattern) => pattern.regionIds) // Corrected flattening logic
-        );
+      const activeSymptomIds = new Set(
+        state.symptomMappings
+          .filter((_mapping) => Math.random() > 0.5) // Prefixed unused parameter
+          .map((mapping) => mapping.symptomId)
+      );
+
+      // Calculate which regions should be active based on symptom mappings,
+      // collecting region IDs straight into a set to dedupe as we go
+      const activatedRegions = new Set<string>();
+      state.symptomMappings.forEach((mapping) => {
+        if (!activeSymptomIds.has(mapping.symptomId)) return;
+        mapping.activationPatterns.forEach((pattern) => {
+          pattern.regionIds.forEach((regionId) => activatedRegions.add(regionId));
+        });
+      });
 
       // Set active regions in state
       dispatch({
         type: 'SET_ACTIVE_REGIONS',
-        payload: [...new Set(activatedRegions)],
+        payload: [...activatedRegions],
       });
     } catch (error) {
       console.error('Error calculating neural activation:', error);
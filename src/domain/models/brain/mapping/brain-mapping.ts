@@ -103,6 +103,15 @@ export interface NeuralImpactRating {
  * Brain Mapping Operations
  */
 
+// Activation scale applied to diagnosis-driven patterns, by diagnosis severity
+const DIAGNOSIS_SEVERITY_SCALE: Record<Diagnosis['severity'], number> = {
+  mild: 0.3,
+  moderate: 0.6,
+  severe: 0.9,
+  'in remission': 0.15,
+  unspecified: 0.5,
+};
+
 // Calculate neural activity level from clinical data
 export function calculateNeuralActivation(
   regions: BrainRegion[],
@@ -119,6 +128,16 @@ export function calculateNeuralActivation(
     const safeActiveSymptoms = new SafeArray(activeSymptoms);
     const safeDiagnosisMappings = new SafeArray(diagnosisMappings);
     const safeActiveDiagnoses = new SafeArray(activeDiagnoses);
+    const findSymptomMapping = createMappingLookup(
+      safeSymptomMappings,
+      (m) => m.symptomId,
+      (m) => m.symptomName
+    );
+    const findDiagnosisMapping = createMappingLookup(
+      safeDiagnosisMappings,
+      (m) => m.diagnosisId,
+      (m) => m.diagnosisName
+    );
 
     // Initialize activation map with 0 values
     const activationMap = new Map<string, number>();
@@ -129,16 +148,16 @@ export function calculateNeuralActivation(
     // Process symptom contributions to neural activation
     safeActiveSymptoms.forEach((symptom) => {
       // Find relevant mapping
-      const mapping = safeSymptomMappings.find(
-        (m) => m.symptomId === symptom.id || m.symptomName === symptom.name
-      );
+      const mapping = findSymptomMapping(symptom.id, symptom.name);
 
       if (!mapping) return;
 
+      const severityFactor = symptom.severity / 10;
+
       // Process each activation pattern
       new SafeArray(mapping.activationPatterns).forEach((pattern) => {
         // Scale activation by symptom severity and pattern confidence
-        const activationStrength = (symptom.severity / 10) * pattern.intensity * pattern.confidence;
+        const activationStrength = severityFactor * pattern.intensity * pattern.confidence;
 
         // Apply activation to each region
         new SafeArray(pattern.regionIds).forEach((regionId) => {
@@ -155,24 +174,15 @@ export function calculateNeuralActivation(
     // Process diagnosis contributions to neural activation
     safeActiveDiagnoses.forEach((diagnosis) => {
       // Find relevant mapping
-      const mapping = safeDiagnosisMappings.find(
-        (m) => m.diagnosisId === diagnosis.id || m.diagnosisName === diagnosis.name
-      );
+      const mapping = findDiagnosisMapping(diagnosis.id, diagnosis.name);
 
       if (!mapping) return;
 
+      const severityFactor = DIAGNOSIS_SEVERITY_SCALE[diagnosis.severity] || 0.5;
+
       // Process each activation pattern
       new SafeArray(mapping.activationPatterns).forEach((pattern) => {
         // Scale activation by diagnosis severity and pattern confidence
-        const severityScale = {
-          mild: 0.3,
-          moderate: 0.6,
-          severe: 0.9,
-          'in remission': 0.15,
-          unspecified: 0.5,
-        };
-
-        const severityFactor = severityScale[diagnosis.severity] || 0.5;
         const activationStrength = severityFactor * pattern.intensity * pattern.confidence;
 
         // Apply activation to each region
@@ -202,6 +212,11 @@ export function mapSymptomsToRegions(
   try {
     const safeSymptomMappings = new SafeArray(symptomMappings);
     const safeActiveSymptoms = new SafeArray(activeSymptoms);
+    const findSymptomMapping = createMappingLookup(
+      safeSymptomMappings,
+      (m) => m.symptomId,
+      (m) => m.symptomName
+    );
 
     // Initialize region to symptoms map
     const regionToSymptomsMap = new Map<string, Symptom[]>();
@@ -209,9 +224,7 @@ export function mapSymptomsToRegions(
     // Process each active symptom
     safeActiveSymptoms.forEach((symptom) => {
       // Find mapping for this symptom
-      const mapping = safeSymptomMappings.find(
-        (m) => m.symptomId === symptom.id || m.symptomName === symptom.name
-      );
+      const mapping = findSymptomMapping(symptom.id, symptom.name);
 
       if (!mapping) return;
 
@@ -245,6 +258,11 @@ export function mapDiagnosesToRegions(
   try {
     const safeDiagnosisMappings = new SafeArray(diagnosisMappings);
     const safeActiveDiagnoses = new SafeArray(activeDiagnoses);
+    const findDiagnosisMapping = createMappingLookup(
+      safeDiagnosisMappings,
+      (m) => m.diagnosisId,
+      (m) => m.diagnosisName
+    );
 
     // Initialize region to diagnoses map
     const regionToDiagnosesMap = new Map<string, Diagnosis[]>();
@@ -252,9 +270,7 @@ export function mapDiagnosesToRegions(
     // Process each active diagnosis
     safeActiveDiagnoses.forEach((diagnosis) => {
       // Find mapping for this diagnosis
-      const mapping = safeDiagnosisMappings.find(
-        (m) => m.diagnosisId === diagnosis.id || m.diagnosisName === diagnosis.name
-      );
+      const mapping = findDiagnosisMapping(diagnosis.id, diagnosis.name);
 
       if (!mapping) return;
 
@@ -300,6 +316,10 @@ export function calculateTreatmentImpact(
       projectedTimeline: '',
     };
 
+    // Index existing impacts by key so merges are O(1) instead of a linear scan
+    const regionImpactIndex = new Map<string, number>();
+    const connectionImpactIndex = new Map<string, number>();
+
     // Process each treatment
     safeTreatmentIds.forEach((treatmentId) => {
       // Find mapping for this treatment
@@ -308,11 +328,25 @@ export function calculateTreatmentImpact(
 
       // Process region impacts
       new SafeArray(mapping.effectPatterns.increasedActivity).forEach((regionId) => {
-        addOrUpdateRegionImpact(impact.regionImpacts, regionId, 'increase', 0.7, 0.8);
+        addOrUpdateRegionImpact(
+          impact.regionImpacts,
+          regionImpactIndex,
+          regionId,
+          'increase',
+          0.7,
+          0.8
+        );
       });
 
       new SafeArray(mapping.effectPatterns.decreasedActivity).forEach((regionId) => {
-        addOrUpdateRegionImpact(impact.regionImpacts, regionId, 'decrease', 0.7, 0.8);
+        addOrUpdateRegionImpact(
+          impact.regionImpacts,
+          regionImpactIndex,
+          regionId,
+          'decrease',
+          0.7,
+          0.8
+        );
       });
 
       // Process connection impacts
@@ -320,6 +354,7 @@ export function calculateTreatmentImpact(
         ([sourceId, targetId]) => {
           addOrUpdateConnectionImpact(
             impact.connectionImpacts,
+            connectionImpactIndex,
             sourceId,
             targetId,
             'normalize',
@@ -334,6 +369,7 @@ export function calculateTreatmentImpact(
         new SafeArray(mechanism.affectedRegions).forEach((regionId) => {
           addOrUpdateRegionImpact(
             impact.regionImpacts,
+            regionImpactIndex,
             regionId,
             'modulate',
             0.8,
@@ -368,17 +404,22 @@ export function calculateTreatmentImpact(
   }
 }
 
+// Separator for impact index keys; a NUL character never appears in region ids
+const impactKeySeparator = '\u0000';
+
 // Helper function for adding or updating region impacts
 function addOrUpdateRegionImpact(
   impacts: NeuralImpactRating['regionImpacts'],
+  index: Map<string, number>,
   regionId: string,
   impact: 'increase' | 'decrease' | 'modulate' | 'normalize',
   magnitude: number,
   confidence: number
 ): void {
-  const existingIndex = impacts.findIndex((ri) => ri.regionId === regionId && ri.impact === impact);
+  const key = [regionId, impact].join(impactKeySeparator);
+  const existingIndex = index.get(key);
 
-  if (existingIndex >= 0) {
+  if (existingIndex !== undefined) {
     // Combine with existing impact using quadratic summation for magnitudes
     const existing = impacts[existingIndex];
     const newMagnitude = Math.sqrt(Math.pow(existing.magnitude, 2) + Math.pow(magnitude, 2));
@@ -392,6 +433,7 @@ function addOrUpdateRegionImpact(
     };
   } else {
     // Add new impact
+    index.set(key, impacts.length);
     impacts.push({
       regionId,
       impact,
@@ -404,17 +446,17 @@ function addOrUpdateRegionImpact(
 // Helper function for adding or updating connection impacts
 function addOrUpdateConnectionImpact(
   impacts: NeuralImpactRating['connectionImpacts'],
+  index: Map<string, number>,
   sourceId: string,
   targetId: string,
   impact: 'increase' | 'decrease' | 'modulate' | 'normalize',
   magnitude: number,
   confidence: number
 ): void {
-  const existingIndex = impacts.findIndex(
-    (ci) => ci.sourceId === sourceId && ci.targetId === targetId && ci.impact === impact
-  );
+  const key = [sourceId, targetId, impact].join(impactKeySeparator);
+  const existingIndex = index.get(key);
 
-  if (existingIndex >= 0) {
+  if (existingIndex !== undefined) {
     // Combine with existing impact using quadratic summation for magnitudes
     const existing = impacts[existingIndex];
     const newMagnitude = Math.sqrt(Math.pow(existing.magnitude, 2) + Math.pow(magnitude, 2));
@@ -428,6 +470,7 @@ function addOrUpdateConnectionImpact(
     };
   } else {
     // Add new impact
+    index.set(key, impacts.length);
     impacts.push({
       sourceId,
       targetId,
@@ -437,3 +480,29 @@ function addOrUpdateConnectionImpact(
     });
   }
 }
+
+// Helper function for indexing mappings by id and by name
+// Lookups resolve to the earliest mapping matching either key, like a linear find
+function createMappingLookup<T>(
+  mappings: SafeArray<T>,
+  getId: (mapping: T) => string,
+  getName: (mapping: T) => string
+): (id: string, name: string) => T | undefined {
+  const items = mappings.toArray();
+  const idIndex = new Map<string, number>();
+  const nameIndex = new Map<string, number>();
+
+  items.forEach((mapping, i) => {
+    const id = getId(mapping);
+    const name = getName(mapping);
+    if (!idIndex.has(id)) idIndex.set(id, i);
+    if (!nameIndex.has(name)) nameIndex.set(name, i);
+  });
+
+  return (id, name) => {
+    const byId = idIndex.get(id) ?? Infinity;
+    const byName = nameIndex.get(name) ?? Infinity;
+    const i = Math.min(byId, byName);
+    return i === Infinity ? undefined : items[i];
+  };
+}
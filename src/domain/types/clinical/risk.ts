@@ -241,6 +241,16 @@ export interface ProcessedRiskTimeline {
   }[];
 }
 
+// Numeric weight of each risk level used in risk scoring
+const riskLevelWeights: Record<RiskLevel, number> = {
+  [RiskLevel.NONE]: 0,
+  [RiskLevel.LOW]: 0.25,
+  [RiskLevel.MODERATE]: 0.5,
+  [RiskLevel.HIGH]: 0.75,
+  [RiskLevel.SEVERE]: 1,
+  [RiskLevel.UNKNOWN]: 0,
+};
+
 // Safe risk assessment operations
 export const RiskAssessmentOps = {
   // Get risk level with null safety
@@ -259,37 +269,29 @@ export const RiskAssessmentOps = {
 
   // Calculate overall risk score with mathematical precision
   calculateRiskScore: (assessment: RiskAssessment): number => {
-    const riskMap: Record<RiskLevel, number> = {
-      [RiskLevel.NONE]: 0,
-      [RiskLevel.LOW]: 0.25,
-      [RiskLevel.MODERATE]: 0.5,
-      [RiskLevel.HIGH]: 0.75,
-      [RiskLevel.SEVERE]: 1,
-      [RiskLevel.UNKNOWN]: 0,
-    };
-
     // Start with overall risk
-    let score = riskMap[assessment.overallRisk] * 0.5;
+    let score = riskLevelWeights[assessment.overallRisk] * 0.5;
 
     // Add weighted domain risks
     const domainRisks = new SafeArray(assessment.domainRisks);
     if (!domainRisks.isEmpty()) {
-      const domainScore =
-        domainRisks
-          .map((dr) => riskMap[dr.riskLevel] * dr.confidenceScore)
-          .reduce((a, b) => a + b, 0) / domainRisks.size();
+      let domainTotal = 0;
+      domainRisks.forEach((dr) => {
+        domainTotal += riskLevelWeights[dr.riskLevel] * dr.confidenceScore;
+      });
 
-      score += domainScore * 0.3;
+      score += (domainTotal / domainRisks.size()) * 0.3;
     }
 
     // Add contributing factors
     const contributingFactors = new SafeArray(assessment.contributingFactors);
     if (!contributingFactors.isEmpty()) {
-      const factorScore =
-        contributingFactors.map((cf) => cf.impactWeight).reduce((a, b) => a + b, 0) /
-        contributingFactors.size();
+      let factorTotal = 0;
+      contributingFactors.forEach((cf) => {
+        factorTotal += cf.impactWeight;
+      });
 
-      score += factorScore * 0.2;
+      score += (factorTotal / contributingFactors.size()) * 0.2;
     }
 
     return Math.min(Math.max(score, 0), 1);
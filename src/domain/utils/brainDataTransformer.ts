@@ -32,35 +32,35 @@ export function transformBrainData(data: unknown): Result<BrainData, Error> {
   }
   const validatedData = validationResult.val;
 
+  // Map straight from the validated arrays so each list is allocated only once
   const processed: BrainData = {
     ...validatedData,
-    regions: [...validatedData.regions],
-    connections: [...validatedData.connections],
+    regions: validatedData.regions.map((region) => {
+      if (!isBrainRegion(region)) {
+        console.warn('Skipping invalid region structure during transformation map:', region);
+        return region;
+      }
+      return {
+        ...region,
+        position: normalizePosition(region.position),
+        activityLevel: region.activityLevel ?? 0,
+        isActive: region.isActive ?? false,
+      };
+    }),
+    connections: validatedData.connections.map((connection) => {
+      if (!isNeuralConnection(connection)) {
+        console.warn(
+          'Skipping invalid connection structure during transformation map:',
+          connection
+        );
+        return connection;
+      }
+      return {
+        ...connection,
+      };
+    }),
   };
 
-  processed.regions = processed.regions.map((region) => {
-    if (!isBrainRegion(region)) {
-      console.warn('Skipping invalid region structure during transformation map:', region);
-      return region;
-    }
-    return {
-      ...region,
-      position: normalizePosition(region.position),
-      activityLevel: region.activityLevel ?? 0,
-      isActive: region.isActive ?? false,
-    };
-  });
-
-  processed.connections = processed.connections.map((connection) => {
-    if (!isNeuralConnection(connection)) {
-      console.warn('Skipping invalid connection structure during transformation map:', connection);
-      return connection;
-    }
-    return {
-      ...connection,
-    };
-  });
-
   return Ok(processed);
 }
 
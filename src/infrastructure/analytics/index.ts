@@ -120,12 +120,10 @@ export class AnalyticsService {
   }
 
   /**
-   * Initialize all providers
+   * Initialize all providers concurrently
    */
   async initialize(options: Record<string, unknown> = {}): Promise<void> {
-    for (const provider of this.providers) {
-      await provider.initialize(options);
-    }
+    await Promise.all(this.providers.map((provider) => provider.initialize(options)));
   }
 
   /**
@@ -152,35 +150,35 @@ export class AnalyticsService {
       properties,
     };
 
-    for (const provider of this.providers) {
-      await provider.trackEvent(event);
-    }
+    await Promise.all(this.providers.map((provider) => provider.trackEvent(event)));
   }
 
   /**
    * Track a page view
    */
   async trackPageView(pageName: string, properties: Record<string, unknown> = {}): Promise<void> {
-    for (const provider of this.providers) {
-      await provider.trackPageView(pageName, {
-        userId: this.userId,
-        sessionId: this.sessionId,
-        ...properties,
-      });
-    }
+    const pageProperties = {
+      userId: this.userId,
+      sessionId: this.sessionId,
+      ...properties,
+    };
+    await Promise.all(
+      this.providers.map((provider) => provider.trackPageView(pageName, pageProperties))
+    );
   }
 
   /**
    * Track an error
    */
   async trackError(error: Error, properties: Record<string, unknown> = {}): Promise<void> {
-    for (const provider of this.providers) {
-      await provider.trackError(error, {
-        userId: this.userId,
-        sessionId: this.sessionId,
-        ...properties,
-      });
-    }
+    const errorProperties = {
+      userId: this.userId,
+      sessionId: this.sessionId,
+      ...properties,
+    };
+    await Promise.all(
+      this.providers.map((provider) => provider.trackError(error, errorProperties))
+    );
   }
 
   /**
@@ -192,8 +190,9 @@ export class AnalyticsService {
       return;
     }
 
-    for (const provider of this.providers) {
-      await provider.setUserProperties(this.userId, properties);
-    }
+    const userId = this.userId;
+    await Promise.all(
+      this.providers.map((provider) => provider.setUserProperties(userId, properties))
+    );
   }
 }
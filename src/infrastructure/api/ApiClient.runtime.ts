@@ -131,9 +131,10 @@ export function transformNestedDates<T>(data: T): T {
 }
 
 // Neural ISO date string validation
+const ISO_DATE_PATTERN = /^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(\.\d{3})?Z?$/;
+
 function isIsoDateString(value: string): boolean {
-  const isoDatePattern = /^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(\.\d{3})?Z?$/;
-  return isoDatePattern.test(value) && !isNaN(Date.parse(value));
+  return ISO_DATE_PATTERN.test(value) && !isNaN(Date.parse(value));
 }
 
 // Neural pagination type definition
@@ -0,0 +1,115 @@
+/* eslint-disable */
+/**
+ * NOVAMIND Neural Test Suite
+ * auditLogClient queueing tests
+ */
+
+import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest';
+import { AuditLogClient, AuditEventType } from './auditLogClient';
+
+describe('AuditLogClient', () => {
+  let client: AuditLogClient;
+  let fetchMock: ReturnType<typeof vi.fn>;
+
+  // Parse the entry sent in a given fetch call
+  const sentEntry = (callIndex: number) => JSON.parse(fetchMock.mock.calls[callIndex][1].body);
+
+  beforeEach(() => {
+    vi.useFakeTimers();
+    vi.stubEnv('NODE_ENV', 'production');
+    fetchMock = vi.fn().mockResolvedValue({ ok: true, status: 204 });
+    vi.stubGlobal('fetch', fetchMock);
+    client = new AuditLogClient();
+  });
+
+  afterEach(() => {
+    client.dispose();
+    vi.useRealTimers();
+    vi.unstubAllEnvs();
+    vi.unstubAllGlobals();
+  });
+
+  it('should flush once 25 entries have queued, posting each entry to the audit endpoint', () => {
+    for (let i = 0; i < 24; i++) {
+      client.log(AuditEventType.PATIENT_RECORD_VIEW, { action: `view_${i}` });
+    }
+    expect(fetchMock).not.toHaveBeenCalled();
+
+    client.log(AuditEventType.PATIENT_RECORD_VIEW, { action: 'view_24' });
+
+    expect(fetchMock).toHaveBeenCalledTimes(25);
+    expect(fetchMock.mock.calls[0][0]).toBe('/api/audit-logs');
+    expect(sentEntry(0)).toMatchObject({ eventType: 'PATIENT_RECORD_VIEW', action: 'view_0' });
+  });
+
+  it('should flush once queued entries reach the byte limit', () => {
+    const details = 'x'.repeat(25 * 1024);
+
+    client.log(AuditEventType.SYSTEM_ERROR, { action: 'error_1', details });
+    client.log(AuditEventType.SYSTEM_ERROR, { action: 'error_2', details });
+    expect(fetchMock).not.toHaveBeenCalled();
+
+    client.log(AuditEventType.SYSTEM_ERROR, { action: 'error_3', details });
+    expect(fetchMock).toHaveBeenCalledTimes(3);
+  });
+
+  it('should flush queued entries after 1s', () => {
+    client.log(AuditEventType.PATIENT_RECORD_VIEW, { action: 'view' });
+    client.log(AuditEventType.BRAIN_MODEL_VIEW, { action: 'view_model' });
+
+    vi.advanceTimersByTime(999);
+    expect(fetchMock).not.toHaveBeenCalled();
+
+    vi.advanceTimersByTime(1);
+    expect(fetchMock).toHaveBeenCalledTimes(2);
+    expect([sentEntry(0).action, sentEntry(1).action]).toEqual(['view', 'view_model']);
+  });
+
+  it('should clear the timer and send exactly one POST on explicit flush', async () => {
+    client.log(AuditEventType.PATIENT_RECORD_VIEW, { action: 'view' });
+
+    await client.flush();
+    vi.advanceTimersByTime(1000);
+
+    expect(fetchMock).toHaveBeenCalledTimes(1);
+    expect(fetchMock.mock.calls[0][1]).toMatchObject({ method: 'POST', keepalive: false });
+    expect(vi.getTimerCount()).toBe(0);
+  });
+
+  it('should send security events immediately', () => {
+    client.log(AuditEventType.PATIENT_RECORD_VIEW, { action: 'view' });
+    client.log(AuditEventType.USER_TIMEOUT, { action: 'session_timeout' });
+
+    expect(fetchMock).toHaveBeenCalledTimes(2);
+  });
+
+  it('should re-queue entries when the server rejects them', async () => {
+    fetchMock.mockResolvedValueOnce({ ok: false, status: 503 });
+    client.log(AuditEventType.PATIENT_RECORD_VIEW, { action: 'view' });
+
+    await client.flush();
+    expect(fetchMock).toHaveBeenCalledTimes(1);
+
+    await vi.advanceTimersByTimeAsync(1000);
+    expect(fetchMock).toHaveBeenCalledTimes(2);
+    expect(sentEntry(1).action).toBe('view');
+  });
+
+  it('should flush queued entries with keepalive on pagehide', () => {
+    client.log(AuditEventType.PATIENT_RECORD_VIEW, { action: 'view' });
+
+    window.dispatchEvent(new Event('pagehide'));
+
+    expect(fetchMock).toHaveBeenCalledTimes(1);
+    expect(fetchMock.mock.calls[0][1]).toMatchObject({ keepalive: true });
+  });
+
+  it('should stop listening for page lifecycle events once disposed', () => {
+    client.log(AuditEventType.PATIENT_RECORD_VIEW, { action: 'view' });
+    client.dispose();
+
+    window.dispatchEvent(new Event('pagehide'));
+
+    expect(fetchMock).not.toHaveBeenCalled();
+  });
+});
@@ -35,6 +35,33 @@ export enum AuditEventType {
   SECURITY_EVENT = 'SECURITY_EVENT',
 }
 
+/**
+ * Event types that are sent immediately rather than held for the next flush
+ */
+const immediateEventTypes = new Set<AuditEventType>([
+  AuditEventType.USER_TIMEOUT,
+  AuditEventType.UNAUTHORIZED_ACCESS_ATTEMPT,
+  AuditEventType.SUSPICIOUS_ACTIVITY,
+  AuditEventType.SECURITY_EVENT,
+]);
+
+// Browsers reject keepalive requests once in-flight bodies exceed 64 KiB; stay below it
+const maxKeepaliveBytes = 60 * 1024;
+
+// Attempts per entry before a persistently failing entry is reported and discarded
+const maxSendAttempts = 5;
+
+const textEncoder = new TextEncoder();
+
+/**
+ * Serialized audit log entry waiting to be sent
+ */
+interface QueuedAuditLog {
+  body: string;
+  bytes: number;
+  attempts: number;
+}
+
 /**
  * Audit log entry interface
  */
@@ -61,9 +88,34 @@ export interface AuditLogEntry {
  * including user access to PHI, system events, and security events.
  * In a production environment, this would send logs to a secure server.
  */
-class AuditLogClient {
+export class AuditLogClient {
   private enabled: boolean = true;
   private endpoint: string = '/api/audit-logs';
+  private queue: QueuedAuditLog[] = [];
+  private queuedBytes: number = 0;
+  private flushTimer: ReturnType<typeof setTimeout> | null = null;
+  private maxBatchSize: number = 25;
+  private maxBatchBytes: number = maxKeepaliveBytes;
+  private flushInterval: number = 1000; // ms
+
+  // Drain the queue before the page is unloaded or backgrounded, so that
+  // closing the tab, reloading or a hard navigation does not drop entries
+  private handlePageHide = (): void => {
+    void this.flush(true);
+  };
+
+  private handleVisibilityChange = (): void => {
+    if (document.visibilityState === 'hidden') void this.flush(true);
+  };
+
+  constructor() {
+    if (typeof window !== 'undefined') {
+      window.addEventListener('pagehide', this.handlePageHide);
+    }
+    if (typeof document !== 'undefined') {
+      document.addEventListener('visibilitychange', this.handleVisibilityChange);
+    }
+  }
 
   /**
    * Log an event to the audit log system
@@ -80,12 +132,13 @@ class AuditLogClient {
         ...data,
       };
 
-      // Log to console in development
-      console.debug(`[AuditLogClient] ${eventType}:`, logEntry);
-
       // In production, send to backend
       if (process.env.NODE_ENV === 'production') {
-        this.sendToServer(logEntry);
+        this.enqueue(logEntry);
+      } else {
+        // Log to console in development only, so production never pays for
+        // formatting entries that the console filters out
+        console.debug(`[AuditLogClient] ${eventType}:`, logEntry);
       }
     } catch (error) {
       console.error('Error sending audit logs:', error);
@@ -93,20 +146,112 @@ class AuditLogClient {
   }
 
   /**
-   * Send log entry to server
+   * Queue an entry for the next flush, flushing immediately once the queue is full
+   * or when the entry is a security event
    */
-  private async sendToServer(logEntry: AuditLogEntry): Promise<void> {
+  private enqueue(logEntry: AuditLogEntry): void {
+    const body = JSON.stringify(logEntry);
+    const queued: QueuedAuditLog = { body, bytes: textEncoder.encode(body).length, attempts: 0 };
+    this.queue.push(queued);
+    this.queuedBytes += queued.bytes;
+
+    if (
+      this.queue.length >= this.maxBatchSize ||
+      this.queuedBytes >= this.maxBatchBytes ||
+      immediateEventTypes.has(logEntry.eventType)
+    ) {
+      void this.flush();
+    } else {
+      this.scheduleFlush();
+    }
+  }
+
+  /**
+   * Start the flush timer if one is not already pending
+   */
+  private scheduleFlush(): void {
+    if (!this.flushTimer) {
+      this.flushTimer = setTimeout(() => void this.flush(), this.flushInterval);
+    }
+  }
+
+  /**
+   * Send all queued entries to the server, one request per entry.
+   * Pass keepalive when flushing during page unload so requests outlive the page.
+   */
+  public async flush(keepalive: boolean = false): Promise<void> {
+    if (this.flushTimer) {
+      clearTimeout(this.flushTimer);
+      this.flushTimer = null;
+    }
+    if (this.queue.length === 0) return;
+
+    const pending = this.queue;
+    this.queue = [];
+    this.queuedBytes = 0;
+
+    // Browsers cap the combined size of in-flight keepalive bodies, so only
+    // entries within that budget are sent with keepalive
+    let keepaliveBytes = 0;
+    await Promise.all(
+      pending.map((entry) => {
+        keepaliveBytes += entry.bytes;
+        return this.sendToServer(entry, keepalive && keepaliveBytes <= maxKeepaliveBytes);
+      })
+    );
+  }
+
+  /**
+   * Send a log entry to server, re-queuing it if the request fails
+   */
+  private async sendToServer(entry: QueuedAuditLog, keepalive: boolean): Promise<void> {
     try {
-      await fetch(this.endpoint, {
+      const response = await fetch(this.endpoint, {
         method: 'POST',
         headers: {
           'Content-Type': 'application/json',
         },
-        body: JSON.stringify(logEntry),
+        body: entry.body,
         credentials: 'include',
+        keepalive,
       });
+
+      if (!response.ok) {
+        throw new Error(`Audit log request failed with status ${response.status}`);
+      }
     } catch (error) {
-      console.error('Error sending audit logs:', error);
+      this.requeue(entry, error);
+    }
+  }
+
+  /**
+   * Put a failed entry back on the queue for the next flush
+   */
+  private requeue(entry: QueuedAuditLog, error: unknown): void {
+    entry.attempts += 1;
+    if (entry.attempts >= maxSendAttempts) {
+      console.error('Error sending audit logs, giving up after repeated failures:', error);
+      return;
+    }
+
+    this.queue.push(entry);
+    this.queuedBytes += entry.bytes;
+    this.scheduleFlush();
+  }
+
+  /**
+   * Remove page lifecycle listeners and cancel any pending flush
+   */
+  public dispose(): void {
+    if (typeof window !== 'undefined') {
+      window.removeEventListener('pagehide', this.handlePageHide);
+    }
+    if (typeof document !== 'undefined') {
+      document.removeEventListener('visibilitychange', this.handleVisibilityChange);
+    }
+    if (this.flushTimer) {
+      clearTimeout(this.flushTimer);
+      this.flushTimer = null;
     }
   }
 
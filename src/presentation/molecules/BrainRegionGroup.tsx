@@ -77,9 +77,13 @@ const BrainRegionGroup: React.FC<BrainRegionGroupProps> = ({
   onRegionHover,
 }) => {
   // Safe array wrappers for null safety
-  const safeRegions = new SafeArray(regions);
-  const safeSelectedIds = new SafeArray(selectedRegionIds);
-  const safeHighlightedIds = new SafeArray(highlightedRegionIds);
+  const safeRegions = useMemo(() => new SafeArray(regions), [regions]);
+  // Selection state as sets, since membership is checked several times per region
+  const selectedIdSet = useMemo(() => new Set(selectedRegionIds ?? []), [selectedRegionIds]);
+  const highlightedIdSet = useMemo(
+    () => new Set(highlightedRegionIds ?? []),
+    [highlightedRegionIds]
+  );
 
   // Calculate which regions to render based on settings
   const filteredRegions = useMemo(() => {
@@ -135,10 +139,10 @@ const BrainRegionGroup: React.FC<BrainRegionGroupProps> = ({
       }
 
       // Use selection/highlight colors from settings if applicable
-      if (safeSelectedIds.includes(region.id) && visualizationSettings.selectionColor) {
+      if (selectedIdSet.has(region.id) && visualizationSettings.selectionColor) {
         return visualizationSettings.selectionColor;
       }
-      if (safeHighlightedIds.includes(region.id) && visualizationSettings.highlightColor) {
+      if (highlightedIdSet.has(region.id) && visualizationSettings.highlightColor) {
         return visualizationSettings.highlightColor;
       }
 
@@ -149,8 +153,8 @@ const BrainRegionGroup: React.FC<BrainRegionGroupProps> = ({
       renderMode,
       visualizationSettings, // Correct dependency
       activityThreshold,
-      safeSelectedIds,
-      safeHighlightedIds,
+      selectedIdSet,
+      highlightedIdSet,
     ]
   );
 
@@ -167,13 +171,14 @@ const BrainRegionGroup: React.FC<BrainRegionGroupProps> = ({
 
       // Scale by connectivity in connectivity mode
       if (renderMode === RenderMode.CONNECTIVITY) {
-        // More connections = slightly larger node
-        const connectionCount = new SafeArray(region.connections).size();
+        // More connections = slightly larger node; read the length directly rather
+        // than wrapping the array for every region on every size calculation
+        const connectionCount = region.connections?.length ?? 0;
         size *= 0.8 + Math.min(connectionCount / 10, 0.5);
       }
 
       // Selected regions are slightly larger
-      if (safeSelectedIds.includes(region.id)) {
+      if (selectedIdSet.has(region.id)) {
         size *= 1.2;
       }
 
@@ -182,9 +187,19 @@ const BrainRegionGroup: React.FC<BrainRegionGroupProps> = ({
 
       return size;
     },
-    [renderMode, safeSelectedIds, scale]
+    [renderMode, selectedIdSet, scale]
   );
 
+  // Resolve each rendered region's size once, shared by meshes and labels
+  // Keyed by region object so regions sharing an id still get their own size
+  const regionSizes = useMemo(() => {
+    const sizes = new Map<BrainRegion, number>();
+    filteredRegions.forEach((region) => {
+      sizes.set(region, getRegionSize(region));
+    });
+    return sizes;
+  }, [filteredRegions, getRegionSize]);
+
   // Removed unused instancedData calculation
 
   // For high performance mode, use simplified rendering
@@ -197,11 +212,13 @@ const BrainRegionGroup: React.FC<BrainRegionGroupProps> = ({
             ? region.position
             : [region.position.x, region.position.y, region.position.z];
 
+          const size = regionSizes.get(region)!;
+
           return (
             <mesh
               key={region.id}
               position={[x, y, z]}
-              scale={[getRegionSize(region), getRegionSize(region), getRegionSize(region)]}
+              scale={[size, size, size]}
               onClick={() => handleRegionClick(region.id)}
             >
               <sphereGeometry args={[1, 8, 8]} />
@@ -285,11 +302,11 @@ const BrainRegionGroup: React.FC<BrainRegionGroupProps> = ({
             key={region.id}
             id={region.id}
             position={[x, y, z]}
-            size={getRegionSize(region)}
+            size={regionSizes.get(region)!}
             color={getRegionColor(region)}
             isActive={region.isActive}
-            isSelected={safeSelectedIds.includes(region.id)}
-            isHighlighted={safeHighlightedIds.includes(region.id)}
+            isSelected={selectedIdSet.has(region.id)}
+            isHighlighted={highlightedIdSet.has(region.id)}
             activityLevel={region.activityLevel}
             pulseEnabled={renderMode !== RenderMode.ANATOMICAL}
             visualizationSettings={visualizationSettings} // Pass the correct prop down
@@ -307,8 +324,8 @@ const BrainRegionGroup: React.FC<BrainRegionGroupProps> = ({
             ? region.position
             : [region.position.x, region.position.y, region.position.z];
 
-          const isSelected = safeSelectedIds.includes(region.id);
-          const isHighlighted = safeHighlightedIds.includes(region.id);
+          const isSelected = selectedIdSet.has(region.id);
+          const isHighlighted = highlightedIdSet.has(region.id);
 
           // Only show labels for active, selected or highlighted regions to reduce visual noise
           if (!isSelected && !isHighlighted && !region.isActive) return null;
@@ -316,7 +333,7 @@ const BrainRegionGroup: React.FC<BrainRegionGroupProps> = ({
           return (
             <Html
               key={`label-${region.id}`}
-              position={[x, y + getRegionSize(region) + 0.3, z]}
+              position={[x, y + regionSizes.get(region)! + 0.3, z]}
               center
               distanceFactor={10}
             >
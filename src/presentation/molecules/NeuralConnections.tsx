@@ -75,10 +75,16 @@ const NeuralConnections: React.FC<NeuralConnectionsProps> = ({
   onConnectionHover,
 }) => {
   // Safe array wrappers for null safety
-  const safeConnections = new SafeArray(connections);
-  const safeRegions = new SafeArray(regions);
-  const safeSelectedIds = new SafeArray(selectedRegionIds);
-  const safeHighlightedIds = new SafeArray(highlightedRegionIds);
+  // Memoized on the incoming arrays so the derived memos below only recompute
+  // when the underlying data changes, not on every render
+  const safeConnections = useMemo(() => new SafeArray(connections), [connections]);
+  const safeRegions = useMemo(() => new SafeArray(regions), [regions]);
+  // Selection state as sets, since membership is checked for both ends of every connection
+  const selectedIdSet = useMemo(() => new Set(selectedRegionIds ?? []), [selectedRegionIds]);
+  const highlightedIdSet = useMemo(
+    () => new Set(highlightedRegionIds ?? []),
+    [highlightedRegionIds]
+  );
 
   // Create a map of regions by ID for efficient lookup
   const regionsById = useMemo(() => {
@@ -89,13 +95,11 @@ const NeuralConnections: React.FC<NeuralConnectionsProps> = ({
     return map;
   }, [safeRegions]);
 
-  // Get position for a region with null safety
-  const getRegionPosition = useCallback(
-    (regionId: string): [number, number, number] => {
-      const region = regionsById.get(regionId);
-      if (!region) return [0, 0, 0];
-
-      // Ensure consistent return type [number, number, number]
+  // Resolve each region's position tuple once per regions change, so that
+  // per-connection lookups during filtering and rendering are a map read
+  const regionPositions = useMemo(() => {
+    const positions = new Map<string, [number, number, number]>();
+    regionsById.forEach((region, regionId) => {
       // Type-safe handling of position formats - check array first
       if (
         Array.isArray(region.position) &&
@@ -103,7 +107,7 @@ const NeuralConnections: React.FC<NeuralConnectionsProps> = ({
         region.position.every((n) => typeof n === 'number')
       ) {
         // If it's an array of 3 numbers, construct the tuple explicitly
-        return [region.position[0], region.position[1], region.position[2]];
+        positions.set(regionId, [region.position[0], region.position[1], region.position[2]]);
       } else if (
         typeof region.position === 'object' &&
         region.position !== null &&
@@ -113,13 +117,20 @@ const NeuralConnections: React.FC<NeuralConnectionsProps> = ({
       ) {
         // If it's a Vector3-like object, construct the tuple
         const pos = region.position as Vector3; // Safe assertion after checks
-        return [pos.x, pos.y, pos.z];
+        positions.set(regionId, [pos.x, pos.y, pos.z]);
+      } else {
+        // Fallback if position format is unexpected or invalid
+        console.warn(`Unexpected position format for region ${regionId}:`, region.position);
+        positions.set(regionId, [0, 0, 0]);
       }
-      // Fallback if position format is unexpected or invalid
-      console.warn(`Unexpected position format for region ${regionId}:`, region.position);
-      return [0, 0, 0];
-    },
-    [regionsById]
+    });
+    return positions;
+  }, [regionsById]);
+
+  // Get position for a region with null safety
+  const getRegionPosition = useCallback(
+    (regionId: string): [number, number, number] => regionPositions.get(regionId) ?? [0, 0, 0],
+    [regionPositions]
   );
 
   // Filter connections based on settings and selection state
@@ -133,9 +144,9 @@ const NeuralConnections: React.FC<NeuralConnectionsProps> = ({
       .slice(0, maximumConnections);
 
     // If specific regions are selected, prioritize their connections
-    if (safeSelectedIds.size() > 0) {
+    if (selectedIdSet.size > 0) {
       filtered = filtered.filter(
-        (conn) => safeSelectedIds.includes(conn.sourceId) || safeSelectedIds.includes(conn.targetId)
+        (conn) => selectedIdSet.has(conn.sourceId) || selectedIdSet.has(conn.targetId)
       );
     }
 
@@ -161,7 +172,7 @@ const NeuralConnections: React.FC<NeuralConnectionsProps> = ({
     safeConnections,
     minimumStrength,
     maximumConnections,
-    safeSelectedIds,
+    selectedIdSet,
     filterByActivity,
     renderMode,
     regionsById,
@@ -218,19 +229,17 @@ const NeuralConnections: React.FC<NeuralConnectionsProps> = ({
   const isConnectionActive = useCallback(
     (conn: NeuralConnection): boolean => {
       // Connection is active if either connected region is selected
-      return safeSelectedIds.includes(conn.sourceId) || safeSelectedIds.includes(conn.targetId);
+      return selectedIdSet.has(conn.sourceId) || selectedIdSet.has(conn.targetId);
     },
-    [safeSelectedIds]
+    [selectedIdSet]
   );
 
   const isConnectionHighlighted = useCallback(
     (conn: NeuralConnection): boolean => {
       // Connection is highlighted if either connected region is highlighted
-      return (
-        safeHighlightedIds.includes(conn.sourceId) || safeHighlightedIds.includes(conn.targetId)
-      );
+      return highlightedIdSet.has(conn.sourceId) || highlightedIdSet.has(conn.targetId);
     },
-    [safeHighlightedIds]
+    [highlightedIdSet]
   );
 
   // Calculate connection activity level based on connected regions
@@ -247,6 +256,9 @@ const NeuralConnections: React.FC<NeuralConnectionsProps> = ({
     [regionsById]
   );
 
+  // Base connection color with its fallback, resolved once per render
+  const baseColor = visualizationSettings.connectionBaseColor || '#FFFFFF';
+
   // Calculate connection color based on various factors
   const getConnectionColor = useCallback(
     (conn: NeuralConnection): string => {
@@ -272,13 +284,13 @@ const NeuralConnections: React.FC<NeuralConnectionsProps> = ({
           return visualizationSettings.inhibitoryConnectionColor;
         }
         // Fallback to base color
-        return visualizationSettings.connectionBaseColor || '#FFFFFF';
+        return baseColor;
       }
 
       // Default color (Anatomical)
-      return visualizationSettings.connectionBaseColor || '#FFFFFF';
+      return baseColor;
     },
-    [renderMode, getConnectionActivity, visualizationSettings] // Depend on visualizationSettings
+    [renderMode, getConnectionActivity, visualizationSettings, baseColor] // Depend on visualizationSettings
   );
 
   // Use optimized batch rendering for high performance mode
@@ -289,7 +301,7 @@ const NeuralConnections: React.FC<NeuralConnectionsProps> = ({
           <Line
             key={`batch-${batchIndex}`}
             points={points}
-            color={visualizationSettings.connectionBaseColor || '#FFFFFF'} // Use setting
+            color={baseColor} // Use setting
             lineWidth={thickness * 100} // drei Line uses different scale
             opacity={opacity}
             transparent
@@ -25,6 +25,9 @@ interface RegionSelectionPanelProps {
 
 // Removed unused AnatomicalGroup and FunctionalGroup types
 
+// Display names for group keys, computed once per key instead of on every render
+const groupDisplayNames = new Map<string, string>();
+
 /**
  * RegionSelectionPanel - Molecular component for region selection interface
  * Implements clinical precision for neuroanatomical organization and selection
@@ -234,10 +237,15 @@ const RegionSelectionPanel: React.FC<RegionSelectionPanelProps> = ({
 
   // Render group name with proper formatting
   const formatGroupName = (groupKey: string): string => {
-    return groupKey
-      .split('_')
-      .map((word) => word.charAt(0).toUpperCase() + word.slice(1))
-      .join(' ');
+    let displayName = groupDisplayNames.get(groupKey);
+    if (displayName === undefined) {
+      displayName = groupKey
+        .split('_')
+        .map((word) => word.charAt(0).toUpperCase() + word.slice(1))
+        .join(' ');
+      groupDisplayNames.set(groupKey, displayName);
+    }
+    return displayName;
   };
 
   // Get group icon based on group key
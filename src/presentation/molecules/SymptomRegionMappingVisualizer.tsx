@@ -367,17 +367,18 @@ export const SymptomRegionMappingVisualizer: React.FC<SymptomRegionMappingVisual
     >();
 
     visibleConnections.forEach((conn) => {
-      // Get or create group
-      if (!groups.has(conn.symptomId)) {
-        groups.set(conn.symptomId, {
+      // Get or create group with a single lookup per connection
+      let group = groups.get(conn.symptomId);
+      if (!group) {
+        group = {
           connections: [],
           position: conn.points[0].clone(),
           isDiagnosis: conn.isDiagnosis,
-        });
+        };
+        groups.set(conn.symptomId, group);
       }
 
       // Add connection to group
-      const group = groups.get(conn.symptomId)!;
       group.connections.push(conn);
     });
 
@@ -128,30 +128,22 @@ export const TemporalDynamicsVisualizer: React.FC<TemporalDynamicsVisualizerProp
     let start = Date.now();
     let end = Date.now();
 
-    // Check transitions
-    if (stateTransitions.length > 0) {
-      const transitionTimes = stateTransitions.flatMap((t) => [
-        t.startState.timestamp,
-        t.startState.timestamp + t.transitionDuration,
-      ]);
-
-      start = Math.min(start, ...transitionTimes);
-      end = Math.max(end, ...transitionTimes);
+    // Check transitions - single pass over the raw timestamps, avoiding the
+    // intermediate arrays and argument spreads of flatMap + Math.min(...)
+    for (const transition of stateTransitions) {
+      const transitionStart = transition.startState.timestamp;
+      const transitionEnd = transitionStart + transition.transitionDuration;
+      if (transitionStart < start) start = transitionStart;
+      if (transitionEnd < start) start = transitionEnd;
+      if (transitionStart > end) end = transitionStart;
+      if (transitionEnd > end) end = transitionEnd;
     }
 
     // Check sequences
-    if (temporalSequences.length > 0) {
-      const sequenceTimes = temporalSequences.flatMap((seq) =>
-        seq.timeSteps.map((step) => step.timeOffset)
-      );
-
-      if (sequenceTimes.length > 0) {
-        const seqStart = Math.min(...sequenceTimes);
-        const seqEnd = Math.max(...sequenceTimes);
-        // Removed unused seqDuration variable
-
-        start = Math.min(start, seqStart);
-        end = Math.max(end, seqEnd);
+    for (const sequence of temporalSequences) {
+      for (const step of sequence.timeSteps) {
+        if (step.timeOffset < start) start = step.timeOffset;
+        if (step.timeOffset > end) end = step.timeOffset;
       }
     }
 
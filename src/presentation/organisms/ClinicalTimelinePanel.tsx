@@ -183,11 +183,15 @@ export const ClinicalTimelinePanel: React.FC<ClinicalTimelinePanelProps> = ({
   const eventsByDate = useMemo(() => {
     // Use 'any' for event type temporarily
     const grouped: Record<string, ClinicalEvent[]> = {}; // Use correct type
+    // Parse each event date once, rather than twice per sort comparison
+    const eventTimes = new Map<ClinicalEvent, number>();
 
     // Use 'any' for event type temporarily
     filteredEvents.forEach((event: ClinicalEvent) => {
       // Use correct type
-      const dateKey = formatDate(new Date(event.date));
+      const eventDate = new Date(event.date);
+      eventTimes.set(event, eventDate.getTime());
+      const dateKey = formatDate(eventDate);
       if (!grouped[dateKey]) {
         grouped[dateKey] = [];
       }
@@ -196,7 +200,7 @@ export const ClinicalTimelinePanel: React.FC<ClinicalTimelinePanelProps> = ({
 
     // Sort events within each day by time
     Object.keys(grouped).forEach((dateKey) => {
-      grouped[dateKey].sort((a, b) => new Date(a.date).getTime() - new Date(b.date).getTime());
+      grouped[dateKey].sort((a, b) => eventTimes.get(a)! - eventTimes.get(b)!);
     });
 
     return grouped;
@@ -204,7 +208,12 @@ export const ClinicalTimelinePanel: React.FC<ClinicalTimelinePanelProps> = ({
 
   // Get sorted dates for the timeline
   const sortedDates = useMemo(() => {
-    return Object.keys(eventsByDate).sort((a, b) => new Date(b).getTime() - new Date(a).getTime());
+    // Parse each date key once up front instead of inside the comparator
+    const dateTimes = new Map<string, number>();
+    Object.keys(eventsByDate).forEach((dateKey) => {
+      dateTimes.set(dateKey, new Date(dateKey).getTime());
+    });
+    return [...dateTimes.keys()].sort((a, b) => dateTimes.get(b)! - dateTimes.get(a)!);
   }, [eventsByDate]);
 
   // Handle filter change
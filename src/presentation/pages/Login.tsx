@@ -5,6 +5,9 @@ import { useNavigate } from 'react-router-dom';
 // import SecureInput from "@atoms/SecureInput"; // Assume this is a styled input, replace with standard input for now
 import { auditLogClient, AuditEventType } from '@infrastructure/clients/auditLogClient'; // Corrected import name
 
+// Basic email shape check, shared across keystrokes
+const EMAIL_PATTERN = /[^@]+@[^@]+\.[^@]+/;
+
 /**
  * Login page component
  * Provides secure authentication with HIPAA-compliant logging
@@ -167,7 +170,7 @@ const Login: React.FC = () => {
                 onChange={(e) => {
                   setEmail(e.target.value);
                   // Basic email validation for demonstration
-                  setEmailValid(/[^@]+@[^@]+\.[^@]+/.test(e.target.value));
+                  setEmailValid(EMAIL_PATTERN.test(e.target.value));
                 }}
                 placeholder="provider@example.com"
                 className="appearance-none block w-full px-3 py-2 border border-gray-300 dark:border-gray-600 rounded-md shadow-sm placeholder-gray-400 dark:placeholder-gray-500 dark:bg-gray-700 dark:text-white focus:outline-none focus:ring-primary-500 focus:border-primary-500"